@@ -1,13 +1,21 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-from collections import Counter
+import os
+import time
 from datetime import datetime, timedelta
 from textwrap import dedent
 
 # 사용자 정의 서비스 임포트
-from services.youtube_service import get_youtube_trending_tags, search_youtube_videos
+from services.youtube_service import get_youtube_trending_tags, search_youtube_videos, search_youtube_videos_batch, rank_videos, rank_batch_results, estimate_search_quota, get_remaining_quota, SHORTS_MAX_SECONDS
 from services.naver_service import get_naver_trending_topics, get_naver_news_list, get_naver_ranking_news
+from services.keyword_sketch import count_keywords, COUNT_MODE_EXACT, COUNT_MODE_APPROX
+from services.models import records_to_dataframe
+from services.cache_backend import get_cache_backend
+from services.thumbnail_cache import prefetch_thumbnails
+from services.search_index import index_documents, search_documents, get_index_stats, SOURCE_NAVER_NEWS, SOURCE_NAVER_RANKING, SOURCE_YOUTUBE
+from services.chart_service import get_top_n_chart, compare_chart_payloads, RENDERER_AUTO, RENDERER_PLOTLY, RENDERER_NATIVE, NATIVE_MAX_ROWS
+from services.trend_service import load_trend_state, record_trend_snapshot, get_rising_keywords, get_snapshot_source, SNAPSHOT_MIN_INTERVAL_MINUTES
 
 # 페이지 설정 (반드시 가장 처음에 호출)
 st.set_page_config(
@@ -148,6 +156,9 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# 일괄 검색 최대 키워드 수 (검색 결과 50개당 검색 API 100 단위 소모)
+BATCH_MAX_KEYWORDS = 50
+
 # --- Shared Utility Functions ---
 def display_news_card_list(items, type='ranking'):
     """
@@ -161,24 +172,24 @@ def display_news_card_list(items, type='ranking'):
         
         # 랭킹 표시
         if type == 'ranking':
-            rank_val = item.get('Rank', idx + 1)
+            rank_val = getattr(item, 'rank', 0) or idx + 1
             rank_html = f"<span class='news-rank'>{rank_val}</span>"
             
         # 요약 표시
-        if item.get('Description'):
-            desc = item['Description'][:200] + "..." if len(item['Description']) > 200 else item['Description']
+        if item.description:
+            desc = item.description[:200] + "..." if len(item.description) > 200 else item.description
             desc_html = f"<div class='news-desc'>{desc}</div>"
             
         # 메타 정보 (날짜 등)
-        if item.get('Date'):
-            date_str = item['Date']
+        if item.date:
+            date_str = item.date
             meta_html = f"<div class='news-meta'>📅 {date_str}</div>"
             
         html_content = f"""
 <div class="news-card">
 <div style="display: flex; align-items: baseline;">
 {rank_html}
-<a href="{item['Link']}" target="_blank" class="news-title">{item['Title']}</a>
+<a href="{item.link}" target="_blank" class="news-title">{item.title}</a>
 </div>
 {desc_html}
 {meta_html}
@@ -188,7 +199,11 @@ def display_news_card_list(items, type='ranking'):
 def display_video_grid(video_list, num_columns=2):
     """
     비디오 리스트를 그리드(앨범) 형태로 출력합니다.
+    썸네일은 로컬 캐시에서 제공하며, 캐시에 없는 것만 한 번에 병렬로 내려받습니다.
+    반환값: 이번 렌더링의 썸네일 캐시 통계
     """
+    thumbnail_paths, thumbnail_stats = prefetch_thumbnails(video_list)
+    
     # 행 단위로 처리
     for i in range(0, len(video_list), num_columns):
         cols = st.columns(num_columns)
@@ -198,23 +213,72 @@ def display_video_grid(video_list, num_columns=2):
         for idx, video in enumerate(row_videos):
             with cols[idx]:
                 # 썸네일 (클릭 시 이동은 안되지만 시각적으로 강조)
-                if video['Thumbnail']:
-                    st.image(video['Thumbnail'], use_container_width=True)
+                if video.thumbnail:
+                    # 다른 프로세스가 캐시 파일을 정리했으면 원격 URL로 대체
+                    thumbnail = thumbnail_paths.get(video.video_id)
+                    if not thumbnail or not os.path.exists(thumbnail):
+                        thumbnail = video.thumbnail
+                    st.image(thumbnail, use_container_width=True)
                 
                 # 제목 (링크 포함)
-                st.markdown(f"**[{video['Title']}]({video['Link']})**")
+                st.markdown(f"**[{video.title}]({video.link})**")
                 
                 # 점수 및 통계 정보
-                if video['Score'] >= 80:
-                    score_str = f":red[**🔥 화제성: {video['Score']}점**]"
-                elif video['Score'] >= 50:
-                    score_str = f":orange[**🔥 화제성: {video['Score']}점**]"
+                if video.score >= 80:
+                    score_str = f":red[**🔥 화제성: {video.score}점**]"
+                elif video.score >= 50:
+                    score_str = f":orange[**🔥 화제성: {video.score}점**]"
                 else:
-                    score_str = f"**🔥 화제성: {video['Score']}점**"
+                    score_str = f"**🔥 화제성: {video.score}점**"
                 
                 st.markdown(score_str)
-                st.caption(f"👁️ {video['Views']:,} | ❤️ {video['Likes']:,} | 📅 {video['Date']}")
+                st.caption(f"👁️ {video.views:,} | ❤️ {video.likes:,} | 📅 {video.date}")
                 st.write("---")
+                
+    return thumbnail_stats
+
+def render_keyword_chart(items, renderer=RENDERER_AUTO, color_scale=None, show_stats=False):
+    """
+    Top-N 키워드 막대 차트를 출력합니다. 차트 스펙은 데이터 해시별로 한 번만 만들어 재사용하며,
+    막대 수가 적으면 Plotly 대신 가벼운 Vega-Lite 차트로 그립니다.
+    """
+    start = time.perf_counter()
+    entry = get_top_n_chart(items, renderer, color_scale)
+    if entry['renderer'] == RENDERER_PLOTLY:
+        st.plotly_chart(entry['chart'], use_container_width=True)
+    else:
+        st.vega_lite_chart(entry['chart'], use_container_width=True)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    if show_stats:
+        payloads = compare_chart_payloads(items, color_scale)
+        saved_kb = (payloads[RENDERER_PLOTLY] - entry['payload_bytes']) / 1024
+        st.caption(
+            f"📐 {'Plotly' if entry['renderer'] == RENDERER_PLOTLY else 'Vega-Lite'} · 전송 크기 {entry['payload_bytes'] / 1024:.1f}KB "
+            f"(Plotly {payloads[RENDERER_PLOTLY] / 1024:.1f}KB / Vega-Lite {payloads[RENDERER_NATIVE] / 1024:.1f}KB, 절감 {saved_kb:.1f}KB) · "
+            f"렌더링 {elapsed_ms:.1f}ms"
+        )
+
+def display_rising_keywords(state, source, top_n=20):
+    """
+    저장된 스냅샷을 기반으로 급상승 키워드를 차트와 표로 출력합니다.
+    """
+    source_state = state.get(source)
+    snapshots = source_state['snapshots'] if source_state else 0
+    if snapshots < 2:
+        st.info(f"급상승 키워드는 스냅샷이 2회 이상 쌓여야 계산됩니다. (현재 {snapshots}회)")
+        return
+
+    rising = get_rising_keywords(state, source, top_n=top_n)
+    st.caption(f"누적 스냅샷 {snapshots}회 · 마지막 갱신 {source_state['updated_at']}")
+    if not rising:
+        st.info("직전 스냅샷 대비 상승한 키워드가 없습니다.")
+        return
+
+    df_rising = pd.DataFrame(rising).sort_values(by='Momentum', ascending=True)
+    fig = px.bar(df_rising, x='Momentum', y='Keyword', orientation='h', text='Delta', color='Growth', color_continuous_scale='Reds')
+    st.plotly_chart(fig, use_container_width=True)
+    st.dataframe(df_rising.sort_values(by='Momentum', ascending=False), hide_index=True, use_container_width=True)
 
 # --- Page Functions ---
 
@@ -225,8 +289,27 @@ def page_trend_analysis():
     # 공통 설정
     with st.expander("분석 옵션 설정", expanded=True):
         max_results = st.slider("분석 데이터 개수", 10, 100, 50, 10)
+        count_mode_label = st.radio(
+            "키워드 집계 방식",
+            ('정확 집계 (Counter)', '근사 집계 (Sketch)'),
+            horizontal=True,
+            help="근사 집계는 Count-Min Sketch + Space-Saving으로 상위 키워드만 추적해 집계 상태의 크기가 고유 단어 수와 무관하게 일정합니다. "
+                 "수집된 단어 리스트는 그대로 메모리에 올라오고 정확 집계보다 느리므로(20만 단어 기준 약 18배), 현재 수집 규모에서는 정확 집계를 권장합니다."
+        )
+        count_mode = COUNT_MODE_APPROX if '근사' in count_mode_label else COUNT_MODE_EXACT
+        col_chart1, col_chart2 = st.columns([3, 1])
+        with col_chart1:
+            renderer_label = st.radio(
+                "차트 렌더링",
+                ('자동', 'Plotly', '경량 차트 (Vega-Lite)'),
+                horizontal=True,
+                help=f"자동: 막대 {NATIVE_MAX_ROWS}개 이하면 경량 차트를 사용합니다."
+            )
+        with col_chart2:
+            show_chart_stats = st.checkbox("렌더링 통계 표시")
+        renderer = {'자동': RENDERER_AUTO, 'Plotly': RENDERER_PLOTLY}.get(renderer_label, RENDERER_NATIVE)
         
-    tab1, tab2 = st.tabs(["📺 YouTube 인기 동영상", "🇰🇷 네이버 검색 트렌드"])
+    tab1, tab2, tab3 = st.tabs(["📺 YouTube 인기 동영상", "🇰🇷 네이버 검색 트렌드", "📈 급상승 키워드"])
     
     # YouTube 탭
     with tab1:
@@ -248,15 +331,21 @@ def page_trend_analysis():
                         max_results=max_results
                     )
                     
+                    index_documents(raw_data_list, SOURCE_YOUTUBE)
+                    
                     if tags:
                         # 시각화
-                        tag_counts = Counter(tags)
+                        tag_counts = count_keywords(tags, mode=count_mode)
                         top_20_tags = tag_counts.most_common(20)
-                        df_tags = pd.DataFrame(top_20_tags, columns=['Keyword', 'Frequency']).sort_values(by='Frequency', ascending=True)
                         
                         st.subheader(f"인기 태그 Top 20 ({selected_country})")
-                        fig = px.bar(df_tags, x='Frequency', y='Keyword', orientation='h', text='Frequency')
-                        st.plotly_chart(fig, use_container_width=True)
+                        render_keyword_chart(top_20_tags, renderer, show_stats=show_chart_stats)
+                        
+                        # 스냅샷 누적 및 급상승 태그 (수집 개수/집계 방식별로 따로 누적)
+                        source = get_snapshot_source(f"youtube_{selected_country}", max_results, count_mode)
+                        trend_state = record_trend_snapshot(source, tag_counts)
+                        st.subheader(f"급상승 태그 ({selected_country})")
+                        display_rising_keywords(trend_state, source)
                         
                         # 데이터 리스트 (카드 UI)
                         with st.expander("상세 데이터 보기"):
@@ -296,15 +385,25 @@ def page_trend_analysis():
                         custom_query=custom_query
                     )
                     
+                    index_documents(articles, SOURCE_NAVER_NEWS)
+                    
                     if words:
                         # 시각화
-                        word_counts = Counter(words)
+                        word_counts = count_keywords(words, mode=count_mode)
                         top_20 = word_counts.most_common(20)
-                        df_words = pd.DataFrame(top_20, columns=['Keyword', 'Frequency']).sort_values(by='Frequency', ascending=True)
                         
                         st.subheader(f"네이버 {naver_category} 키워드 Top 20")
-                        fig = px.bar(df_words, x='Frequency', y='Keyword', orientation='h', text='Frequency', color='Frequency', color_continuous_scale='Viridis')
-                        st.plotly_chart(fig, use_container_width=True)
+                        render_keyword_chart(top_20, renderer, color_scale='Viridis', show_stats=show_chart_stats)
+                        
+                        # 스냅샷 누적 및 급상승 키워드 (직접 입력한 검색어, 수집 개수/집계 방식별로 별도 소스로 관리)
+                        if custom_query and custom_query.strip():
+                            base_source = f"naver_query_{custom_query.strip()}"
+                        else:
+                            base_source = f"naver_{cat_map[naver_category]}"
+                        source = get_snapshot_source(base_source, max_results, count_mode)
+                        trend_state = record_trend_snapshot(source, word_counts)
+                        st.subheader(f"네이버 {naver_category} 급상승 키워드")
+                        display_rising_keywords(trend_state, source)
                         
                         # 데이터 리스트 (카드 UI)
                         with st.expander("수집된 기사 목록"):
@@ -312,15 +411,137 @@ def page_trend_analysis():
                     else:
                         st.warning("트렌드 데이터를 찾을 수 없습니다.")
 
+    # 급상승 키워드 탭 (저장된 스냅샷 기반, API 호출 없음)
+    with tab3:
+        st.markdown(f"YouTube/네이버 탭에서 분석할 때 스냅샷이 누적되며(같은 소스는 최소 {SNAPSHOT_MIN_INTERVAL_MINUTES}분 간격, 분석 데이터 개수와 집계 방식별로 구분), 직전 대비 빈도 변화와 이동평균(EMA)으로 급상승 키워드를 계산합니다.")
+        trend_state = load_trend_state()
+        if not trend_state:
+            st.info("저장된 스냅샷이 없습니다. 먼저 YouTube 또는 네이버 분석을 실행해주세요.")
+        else:
+            selected_source = st.selectbox("데이터 소스", sorted(trend_state.keys()), key='rising_source')
+            rising_top_n = st.slider("표시 개수", 5, 50, 20, 5, key='rising_top_n')
+            display_rising_keywords(trend_state, selected_source, top_n=rising_top_n)
+
+def get_published_after(date_range):
+    """
+    게시일 필터 선택값을 YouTube API의 publishedAfter(RFC 3339) 값으로 변환합니다.
+    """
+    # 응답 캐시 키가 매 실행마다 달라지지 않도록 시간 단위로 절삭
+    now = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+    if date_range == '최근 1주':
+        return (now - timedelta(weeks=1)).isoformat() + 'Z'
+    elif date_range == '최근 1개월':
+        return (now - timedelta(days=30)).isoformat() + 'Z'
+    elif date_range == '최근 1년':
+        return (now - timedelta(days=365)).isoformat() + 'Z'
+    return None
+
+def parse_keyword_input(text, uploaded_file=None):
+    """
+    줄바꿈/쉼표로 구분된 키워드 입력과 업로드 파일(txt, csv)을 키워드 리스트로 합칩니다.
+    """
+    raw = text or ""
+    if uploaded_file is not None:
+        raw += "\n" + uploaded_file.getvalue().decode('utf-8-sig', errors='ignore')
+    keywords = [kw.strip() for line in raw.splitlines() for kw in line.split(',')]
+    return list(dict.fromkeys(kw for kw in keywords if kw))
+
+def render_youtube_batch_search(yt_region, date_range, yt_max, sort_key, shorts_threshold):
+    """
+    여러 키워드를 한 번에 검색하고 키워드별로 태깅된 결과 테이블을 출력합니다.
+    """
+    if 'yt_batch_results' not in st.session_state:
+        st.session_state['yt_batch_results'] = []
+
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        keyword_text = st.text_area("검색어 목록 (줄바꿈 또는 쉼표로 구분)", height=150, placeholder="아이돌 직캠\n요리 레시피\n캠핑")
+    with col2:
+        keyword_file = st.file_uploader("키워드 파일 업로드", type=['txt', 'csv'])
+        batch_workers = st.slider("동시 요청 수", 1, 8, 4, key='yt_batch_workers')
+
+    keywords = parse_keyword_input(keyword_text, keyword_file)
+    api_key = st.secrets.get("YOUTUBE_API_KEY", "")
+    cost_per_keyword = estimate_search_quota(yt_max)
+    remaining_quota = get_remaining_quota(api_key) if api_key else None
+    quota_caption = f"키워드 {len(keywords)}개 (최대 {BATCH_MAX_KEYWORDS}개) · 예상 할당량 {cost_per_keyword * len(keywords):,} 단위 (키워드당 {cost_per_keyword:,})"
+    if remaining_quota is not None:
+        quota_caption += f" · 오늘 남은 할당량 {remaining_quota:,}"
+    st.caption(quota_caption)
+    batch_btn = st.button("일괄 검색 시작 🔍", key='yt_batch_start')
+
+    if batch_btn:
+        if not api_key:
+            st.error("⚠️ YouTube API Key가 없습니다.")
+        elif not keywords:
+            st.warning("경고: 검색어를 입력해주세요.")
+        else:
+            if len(keywords) > BATCH_MAX_KEYWORDS:
+                st.warning(f"키워드가 너무 많아 앞의 {BATCH_MAX_KEYWORDS}개만 검색합니다.")
+                keywords = keywords[:BATCH_MAX_KEYWORDS]
+
+            # 남은 일일 할당량 안에서 끝까지 실행할 수 있는 키워드만 검색 (도중 실패 방지)
+            affordable = remaining_quota // cost_per_keyword if remaining_quota is not None else len(keywords)
+            if affordable == 0:
+                st.error(f"⚠️ 남은 할당량({remaining_quota:,})이 키워드 1개 검색 비용({cost_per_keyword:,})보다 적습니다. 검색 개수를 줄이거나 내일 다시 시도해주세요.")
+                return
+            if affordable < len(keywords):
+                st.warning(f"남은 할당량({remaining_quota:,}) 안에서 앞의 {affordable}개 키워드만 검색합니다.")
+                keywords = keywords[:affordable]
+
+            progress = st.progress(0.0, text="일괄 검색 준비 중...")
+
+            def on_progress(done, total, query):
+                progress.progress(done / total, text=f"검색 중... ({done}/{total}) '{query}' 완료")
+
+            results, failed = search_youtube_videos_batch(
+                api_key,
+                keywords,
+                max_results=yt_max,
+                region_code=yt_region,
+                published_after=get_published_after(date_range),
+                max_workers=batch_workers,
+                progress_callback=on_progress
+            )
+            progress.empty()
+            index_documents(results, SOURCE_YOUTUBE)
+
+            st.session_state['yt_batch_results'] = results
+            if failed:
+                st.warning(f"검색에 실패한 키워드: {', '.join(failed)}")
+
+    results = st.session_state['yt_batch_results']
+    if not results:
+        return
+
+    # 분류/점수화는 세션에 보관한 결과에 적용 (숏폼 기준/정렬 변경 시 재검색 없음)
+    df_batch = records_to_dataframe(rank_batch_results(results, sort_key, shorts_threshold))
+    sort_column = 'Score' if sort_key == 'trend' else 'Views'
+    df_batch = df_batch.sort_values(by=['Keyword', sort_column], ascending=[True, False])
+
+    st.subheader(f"일괄 검색 결과 ({len(df_batch)}건, 키워드 {df_batch['Keyword'].nunique()}개)")
+    summary = df_batch.groupby(['Keyword', 'Type']).size().unstack(fill_value=0)
+    st.dataframe(summary, use_container_width=True)
+    st.dataframe(
+        df_batch[['Keyword', 'Type', 'Title', 'Score', 'Views', 'Likes', 'Date', 'Link']],
+        hide_index=True,
+        use_container_width=True,
+        column_config={'Link': st.column_config.LinkColumn('Link')}
+    )
+    st.download_button(
+        "CSV 다운로드",
+        df_batch.drop(columns=['Thumbnail', 'Description', 'Tags']).to_csv(index=False).encode('utf-8-sig'),
+        file_name="youtube_batch_results.csv",
+        mime="text/csv"
+    )
+
 def page_youtube_analysis():
     st.title("🎥 유튜브 영상 검색 및 분석")
     st.markdown("키워드로 영상을 검색하고 **롱폼(Long-form)**과 **숏폼(Shorts)**으로 구분하여 분석합니다.")
     
     # Initialize session state
-    if 'yt_long_forms' not in st.session_state:
-        st.session_state['yt_long_forms'] = []
-    if 'yt_shorts' not in st.session_state:
-        st.session_state['yt_shorts'] = []
+    if 'yt_videos' not in st.session_state:
+        st.session_state['yt_videos'] = []
     if 'yt_search_done' not in st.session_state:
         st.session_state['yt_search_done'] = False
         
@@ -334,11 +555,20 @@ def page_youtube_analysis():
             date_range = st.selectbox("게시일 필터", ['전체', '최근 1주', '최근 1개월', '최근 1년'], index=0)
         with col_opt3:
             yt_max = st.slider("검색 개수", 50, 200, 50, 10, key='yt_max_search')
+        shorts_threshold = st.slider(
+            "숏폼 기준 (초 이하)", 30, 180, SHORTS_MAX_SECONDS, 15, key='yt_shorts_threshold',
+            help="YouTube Shorts는 최대 3분(180초)까지 업로드할 수 있습니다."
+        )
 
     # 정렬 옵션
     sort_option = st.radio("정렬 기준", ["🔥 화제성 순 (Trend Score)", "👁️ 조회수 순 (View Count)"], horizontal=True, key='yt_sort')
     sort_key = 'trend' if '화제성' in sort_option else 'viewCount'
 
+    search_mode = st.radio("검색 방식", ["단일 키워드", "일괄 검색 (여러 키워드)"], horizontal=True, key='yt_mode')
+    if search_mode != "단일 키워드":
+        render_youtube_batch_search(yt_region, date_range, yt_max, sort_key, shorts_threshold)
+        return
+
     col1, col2 = st.columns([3, 1])
     with col1:
         yt_query = st.text_input("검색어 입력", placeholder="예: 아이돌 직캠, 요리 레시피")
@@ -356,43 +586,28 @@ def page_youtube_analysis():
                 st.warning("경고: 검색어를 입력해주세요.")
             else:
                 # 날짜 필터 로직
-                published_after = None
-                now = datetime.utcnow()
-                if date_range == '최근 1주':
-                    published_after = (now - timedelta(weeks=1)).isoformat() + 'Z'
-                elif date_range == '최근 1개월':
-                    published_after = (now - timedelta(days=30)).isoformat() + 'Z'
-                elif date_range == '최근 1년':
-                    published_after = (now - timedelta(days=365)).isoformat() + 'Z'
+                published_after = get_published_after(date_range)
 
                 with st.spinner(f"'{yt_query}' ({yt_region}, {date_range}) 관련 영상을 검색 중입니다..."):
-                    # Initial search (sorting doesn't matter much here as we resort later, but fetching needed data)
-                    long_forms, shorts = search_youtube_videos(
+                    # 분류/정렬 옵션과 무관하게 검색 (응답 캐시 키에 숏폼 기준이 포함되지 않도록 함)
+                    videos = search_youtube_videos(
                         api_key, 
                         yt_query, 
                         max_results=yt_max,
                         region_code=yt_region,
-                        published_after=published_after,
-                        sort_by='trend' # Default fetch sort
+                        published_after=published_after
                     )
                     
+                    index_documents(videos, SOURCE_YOUTUBE)
+                    
                     # Store in session state
-                    st.session_state['yt_long_forms'] = long_forms
-                    st.session_state['yt_shorts'] = shorts
+                    st.session_state['yt_videos'] = videos
                     st.session_state['yt_search_done'] = True
                     
     # Display Results (from Session State)
     if st.session_state.get('yt_search_done'):
-        long_forms = st.session_state['yt_long_forms']
-        shorts = st.session_state['yt_shorts']
-        
-        # Apply Sorting (Client-side)
-        if sort_key == 'trend':
-            long_forms.sort(key=lambda x: x['Score'], reverse=True)
-            shorts.sort(key=lambda x: x['Score'], reverse=True)
-        else: # viewCount
-            long_forms.sort(key=lambda x: x['Views'], reverse=True)
-            shorts.sort(key=lambda x: x['Views'], reverse=True)
+        # Apply Classification & Sorting (Client-side, API 호출 없음)
+        long_forms, shorts, duration_buckets = rank_videos(st.session_state['yt_videos'], sort_key, shorts_threshold)
 
         # 결과 표시
         if not long_forms and not shorts:
@@ -401,13 +616,22 @@ def page_youtube_analysis():
             if yt_search_btn: # Show success only on fresh search triggers to avoid annoyance
                 st.success(f"검색 완료! 롱폼 {len(long_forms)}개, 숏폼 {len(shorts)}개 발견")
             
+            # 영상 길이 분포
+            if duration_buckets:
+                with st.expander("⏱️ 영상 길이 분포", expanded=False):
+                    df_duration = pd.DataFrame(list(duration_buckets.items()), columns=['Duration', 'Count'])
+                    fig = px.bar(df_duration, x='Duration', y='Count', text='Count')
+                    st.plotly_chart(fig, use_container_width=True)
+            
+            render_start = time.perf_counter()
+            grid_stats = []
             col_long, col_short = st.columns(2)
             
             # 왼쪽: 롱폼
             with col_long:
                 st.subheader(f"🎬 롱폼 영상 ({len(long_forms)})")
                 if long_forms:
-                    display_video_grid(long_forms, num_columns=2)
+                    grid_stats.append(display_video_grid(long_forms, num_columns=2))
                 else:
                     st.info("롱폼 영상이 없습니다.")
                     
@@ -415,15 +639,26 @@ def page_youtube_analysis():
             with col_short:
                 st.subheader(f"📱 숏폼 영상 ({len(shorts)})")
                 if shorts:
-                    display_video_grid(shorts, num_columns=2)
+                    grid_stats.append(display_video_grid(shorts, num_columns=2))
                 else:
                     st.info("숏폼 영상이 없습니다.")
+                    
+            # 이번 렌더링의 썸네일 캐시 효과
+            render_ms = (time.perf_counter() - render_start) * 1000
+            hits = sum(stats['hits'] for stats in grid_stats)
+            downloads = sum(stats['downloads'] for stats in grid_stats)
+            downloaded_kb = sum(stats['downloaded_bytes'] for stats in grid_stats) / 1024
+            served_kb = sum(stats['served_bytes'] for stats in grid_stats) / 1024
+            st.caption(
+                f"🖼️ 결과 렌더링 {render_ms:.0f}ms · 썸네일 캐시 적중 {hits:,}개(원격 요청 생략) / 신규 다운로드 {downloads:,}개 ({downloaded_kb:,.0f}KB) · "
+                f"로컬 캐시에서 제공 {served_kb:,.0f}KB"
+            )
 
 def page_naver_news():
     st.title("🗞️ 네이버 뉴스")
     
     # 탭으로 구분: 실시간 랭킹 / 뉴스 검색
-    tab1, tab2 = st.tabs(["🔥 많이 본 뉴스 50", "🔍 뉴스 검색"])
+    tab1, tab2, tab3 = st.tabs(["🔥 많이 본 뉴스 50", "🔍 뉴스 검색", "📚 수집 기록 검색"])
     
     # --- Tab 1: 많이 본 뉴스 50 (Ranking) ---
     with tab1:
@@ -432,11 +667,12 @@ def page_naver_news():
             st.subheader("언론사별 많이 본 뉴스 (Top 50)")
         with col_btn:
             if st.button("뉴스 새로고침", key='refresh_ranking'):
-                st.cache_data.clear()
+                get_cache_backend().clear('naver_ranking:')
             
         # 데이터를 가져옵니다. (자동 로드)
         with st.spinner("많이 본 뉴스를 가져오는 중입니다..."):
             ranking_news = get_naver_ranking_news(limit=50)
+            index_documents(ranking_news, SOURCE_NAVER_RANKING)
             
         if ranking_news:
             display_news_card_list(ranking_news, type='ranking')
@@ -473,6 +709,7 @@ def page_naver_news():
                         display=100, 
                         sort=sort_val
                     )
+                    index_documents(news_list, SOURCE_NAVER_NEWS)
                     
                     if news_list:
                         st.success(f"{len(news_list)}개의 뉴스를 가져왔습니다.")
@@ -480,6 +717,37 @@ def page_naver_news():
                     else:
                         st.warning("검색 결과가 없습니다.")
 
+    # --- Tab 3: 로컬 인덱스 검색 (API 호출 없음) ---
+    with tab3:
+        st.subheader("수집 기록 검색")
+        st.markdown("지금까지 불러온 뉴스와 유튜브 영상의 제목/설명을 로컬 인덱스에서 검색합니다. API 호출이 발생하지 않습니다.")
+
+        index_stats = get_index_stats()
+        source_labels = {
+            '전체': None,
+            '네이버 뉴스 검색': SOURCE_NAVER_NEWS,
+            '네이버 많이 본 뉴스': SOURCE_NAVER_RANKING,
+            '유튜브': SOURCE_YOUTUBE,
+        }
+        st.caption(" | ".join(f"{label}: {index_stats.get(src, 0):,}건" for label, src in source_labels.items() if src))
+
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            history_query = st.text_input("검색어 입력", key='history_query', placeholder="예: 반도체, 아이돌")
+        with col2:
+            history_source = st.selectbox("출처", list(source_labels.keys()), key='history_source')
+
+        if history_query:
+            start = time.perf_counter()
+            history_results = search_documents(history_query, source=source_labels[history_source], limit=100)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            if history_results:
+                st.success(f"{len(history_results)}건 검색됨 ({elapsed_ms:.1f}ms)")
+                display_news_card_list(history_results, type='search')
+            else:
+                st.warning("일치하는 기록이 없습니다.")
+
 def page_settings():
     st.title("⚙️ API 키 설정")
     st.markdown("`.streamlit/secrets.toml` 파일에 저장된 키를 확인하거나 임시로 입력할 수 있습니다.")
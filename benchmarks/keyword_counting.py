@@ -0,0 +1,61 @@
+"""
+정확 집계(Counter)와 근사 집계(Count-Min Sketch + Space-Saving)의 정확도/메모리/속도 비교.
+
+실행: python -m benchmarks.keyword_counting [총 단어 수] [고유 단어 수]
+"""
+import random
+import sys
+import time
+import tracemalloc
+from collections import Counter
+
+from services.keyword_sketch import count_keywords, COUNT_MODE_EXACT, COUNT_MODE_APPROX
+
+TOP_N = 20
+
+
+def make_words(total_words, vocab_size, seed=42):
+    """
+    실제 제목/태그 분포와 비슷한 Zipf 분포의 한글 키워드를 생성합니다.
+    """
+    rng = random.Random(seed)
+    syllables = [chr(code) for code in range(0xAC00, 0xAC00 + 400)]
+    vocab = list({''.join(rng.choice(syllables) for _ in range(rng.randint(2, 4))) for _ in range(vocab_size)})
+    weights = [1 / (rank + 1) for rank in range(len(vocab))]
+    return rng.choices(vocab, weights=weights, k=total_words)
+
+
+def measure(words, mode):
+    # 시간은 tracemalloc 오버헤드 없이 따로 측정
+    start = time.perf_counter()
+    count_keywords(words, mode=mode)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    counts = count_keywords(words, mode=mode)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return counts, elapsed, peak
+
+
+def main():
+    total_words = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    vocab_size = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+    words = make_words(total_words, vocab_size)
+    truth = Counter(words)
+
+    print(f"단어 {total_words:,}개 / 고유 단어 {len(truth):,}개")
+    for mode in (COUNT_MODE_EXACT, COUNT_MODE_APPROX):
+        counts, elapsed, peak = measure(words, mode)
+        top = counts.most_common(TOP_N)
+
+        true_top = {word for word, _ in truth.most_common(TOP_N)}
+        recall = len(true_top & {word for word, _ in top}) / TOP_N
+        rel_error = sum(abs(count - truth[word]) / truth[word] for word, count in top) / len(top)
+
+        print(f"[{mode:>6}] 시간 {elapsed * 1000:8.1f}ms | 최대 메모리 {peak / 1024:8.1f}KB | "
+              f"Top{TOP_N} 재현율 {recall:.0%} | 평균 상대오차 {rel_error:.2%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,282 @@
+import functools
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+
+# 백엔드 선택: 환경 변수 TREND_CACHE_BACKEND = 'sqlite'(기본) | 'memory'
+CACHE_BACKEND_ENV = "TREND_CACHE_BACKEND"
+CACHE_PATH_ENV = "TREND_CACHE_PATH"
+DEFAULT_CACHE_PATH = os.path.join("data", "cache.db")
+
+# 만료되는 API 응답 캐시와 장기 보관 상태(트렌드 이력 등)는 서로 다른 테이블에 저장
+# 캐시를 비워도(clear) 상태 테이블은 영향을 받지 않습니다.
+CACHE_TABLE = "cache"
+STATE_TABLE = "state"
+
+
+class CacheBackend(ABC):
+    """
+    서비스 응답 캐시와 저장 결과를 위한 키-값 저장소 인터페이스.
+    값은 pickle 가능한 객체이며, 키는 'namespace:...' 형태의 문자열입니다.
+    Redis 등 외부 저장소는 이 메서드들만 구현하면 교체할 수 있습니다.
+    (update는 WATCH/MULTI 같은 원자적 읽기-수정-쓰기로 구현)
+    """
+
+    @abstractmethod
+    def get(self, key, default=None):
+        """만료되지 않은 값을 반환합니다. 없으면 default."""
+
+    @abstractmethod
+    def set(self, key, value, ttl=None):
+        """값을 저장합니다. ttl(초)이 None이면 만료되지 않습니다."""
+
+    @abstractmethod
+    def delete(self, key):
+        """키를 삭제합니다."""
+
+    @abstractmethod
+    def clear(self, namespace=None):
+        """namespace로 시작하는 키(None이면 전체)를 삭제합니다."""
+
+    @abstractmethod
+    def update(self, key, func, default=None, ttl=None):
+        """
+        현재 값(없으면 default)에 func를 적용한 결과를 원자적으로 저장하고 반환합니다.
+        여러 프로세스가 같은 키를 동시에 갱신해도 변경이 유실되지 않아야 합니다.
+        """
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    프로세스 내부 메모리 백엔드. 단일 프로세스 실행이나 테스트용 대체 구현입니다.
+    값은 pickle 바이트로 보관하여 꺼낸 결과를 수정해도 캐시에 영향을 주지 않습니다.
+    """
+
+    def __init__(self):
+        self._data = {}
+        self._lock = threading.RLock()
+
+    def _get_raw(self, key):
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        payload, expires_at = entry
+        if expires_at is not None and expires_at <= time.time():
+            del self._data[key]
+            return None
+        return payload
+
+    def _purge_expired(self):
+        now = time.time()
+        for key in [k for k, (_, expires_at) in self._data.items() if expires_at is not None and expires_at <= now]:
+            del self._data[key]
+
+    def get(self, key, default=None):
+        with self._lock:
+            payload = self._get_raw(key)
+        return default if payload is None else pickle.loads(payload)
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.time() + ttl if ttl else None
+        with self._lock:
+            self._data[key] = (pickle.dumps(value), expires_at)
+            self._purge_expired()
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self, namespace=None):
+        with self._lock:
+            if namespace is None:
+                self._data.clear()
+            else:
+                for key in [k for k in self._data if k.startswith(namespace)]:
+                    del self._data[key]
+
+    def update(self, key, func, default=None, ttl=None):
+        with self._lock:
+            payload = self._get_raw(key)
+            value = func(default if payload is None else pickle.loads(payload))
+            self.set(key, value, ttl)
+            return value
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    로컬 디스크(SQLite) 백엔드. 같은 호스트의 여러 Streamlit 프로세스가 하나의 파일을 공유합니다.
+    table로 저장 테이블을 구분하며, 모든 연산은 해당 테이블에만 적용됩니다.
+    WAL 모드로 읽기와 쓰기가 서로 막지 않으며, 쓰기 충돌은 SQLite 파일 잠금과 busy_timeout으로 대기합니다.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, table=CACHE_TABLE, busy_timeout=30):
+        if not table.isidentifier():
+            raise ValueError(f"잘못된 테이블 이름: {table}")
+        self.path = path
+        self.table = table
+        self.busy_timeout = busy_timeout
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = self._connect()
+        with conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)"
+            )
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_expires_at ON {table} (expires_at)")
+        conn.close()
+
+    def _connect(self):
+        # 연결은 호출마다 생성 (스레드/프로세스 간 공유하지 않음), 트랜잭션은 직접 제어
+        return sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+
+    def _read(self, conn, key):
+        row = conn.execute(f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        payload, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            return None
+        return payload
+
+    def _purge_expired(self, conn):
+        # 만료된 행은 읽을 때 무시되지만 파일에는 남으므로 쓰기 시점에 함께 삭제
+        conn.execute(f"DELETE FROM {self.table} WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),))
+
+    def _write(self, conn, key, value, ttl):
+        expires_at = time.time() + ttl if ttl else None
+        conn.execute(
+            f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, pickle.dumps(value), expires_at)
+        )
+
+    def get(self, key, default=None):
+        conn = self._connect()
+        try:
+            payload = self._read(conn, key)
+        finally:
+            conn.close()
+        return default if payload is None else pickle.loads(payload)
+
+    def set(self, key, value, ttl=None):
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("BEGIN")
+                self._write(conn, key, value, ttl)
+                self._purge_expired(conn)
+        finally:
+            conn.close()
+
+    def delete(self, key):
+        conn = self._connect()
+        try:
+            conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+        finally:
+            conn.close()
+
+    def clear(self, namespace=None):
+        conn = self._connect()
+        try:
+            if namespace is None:
+                conn.execute(f"DELETE FROM {self.table}")
+            else:
+                # LIKE 와일드카드 대신 범위 조건으로 접두사 검색
+                conn.execute(f"DELETE FROM {self.table} WHERE key >= ? AND key < ?", (namespace, namespace + "￿"))
+            self._purge_expired(conn)
+        finally:
+            conn.close()
+
+    def update(self, key, func, default=None, ttl=None):
+        conn = self._connect()
+        try:
+            # BEGIN IMMEDIATE: 다른 프로세스의 쓰기를 막은 상태에서 읽기-수정-쓰기
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                payload = self._read(conn, key)
+                value = func(default if payload is None else pickle.loads(payload))
+                self._write(conn, key, value, ttl)
+                self._purge_expired(conn)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            return value
+        finally:
+            conn.close()
+
+
+_backends = {}
+_backend_lock = threading.Lock()
+
+
+def _get_backend(table):
+    with _backend_lock:
+        if table not in _backends:
+            if os.environ.get(CACHE_BACKEND_ENV, 'sqlite') == 'memory':
+                _backends[table] = MemoryCacheBackend()
+            else:
+                _backends[table] = SQLiteCacheBackend(os.environ.get(CACHE_PATH_ENV, DEFAULT_CACHE_PATH), table=table)
+        return _backends[table]
+
+
+def get_cache_backend():
+    """
+    프로세스 전역 캐시 백엔드(만료되는 API 응답용)를 반환합니다. (최초 호출 시 환경 변수에 따라 생성)
+    """
+    return _get_backend(CACHE_TABLE)
+
+
+def get_state_backend():
+    """
+    장기 보관 상태용 백엔드를 반환합니다. 캐시 백엔드의 clear()와 만료 정리에 영향을 받지 않습니다.
+    """
+    return _get_backend(STATE_TABLE)
+
+
+def set_cache_backend(backend, state_backend=None):
+    """
+    캐시/상태 백엔드를 교체합니다. (테스트에서 MemoryCacheBackend 주입 등)
+    """
+    with _backend_lock:
+        _backends[CACHE_TABLE] = backend
+        if state_backend is not None:
+            _backends[STATE_TABLE] = state_backend
+
+
+def _is_empty_result(result):
+    # 서비스 함수는 오류 시 빈 리스트(또는 빈 값들의 튜플)를 반환하므로 캐시하지 않음
+    if isinstance(result, tuple):
+        return not any(result)
+    return not result
+
+
+def cached(namespace, ttl):
+    """
+    서비스 함수의 응답을 공유 캐시 백엔드에 저장하는 데코레이터.
+    키는 namespace와 인자(API 키 포함)의 해시로 만들며, 빈 결과는 저장하지 않습니다.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            digest = hashlib.sha256(pickle.dumps((args, sorted(kwargs.items())))).hexdigest()
+            key = f"{namespace}:{digest}"
+
+            backend = get_cache_backend()
+            result = backend.get(key)
+            if result is not None:
+                return result
+
+            result = func(*args, **kwargs)
+            if not _is_empty_result(result):
+                backend.set(key, result, ttl)
+            return result
+        return wrapper
+    return decorator
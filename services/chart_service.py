@@ -0,0 +1,102 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+import pandas as pd
+import plotly.express as px
+
+# 차트 렌더링 방식
+RENDERER_AUTO = 'auto'
+RENDERER_PLOTLY = 'plotly'
+RENDERER_NATIVE = 'native'   # Streamlit 내장 Vega-Lite
+
+# 자동 모드에서 경량(Vega-Lite) 차트를 사용할 최대 막대 수
+NATIVE_MAX_ROWS = 30
+
+# 메모이즈할 차트 수 (데이터 해시 기준 LRU)
+CHART_CACHE_SIZE = 64
+
+_chart_cache = OrderedDict()
+_chart_cache_lock = threading.Lock()
+
+
+def content_hash(items):
+    """
+    (키워드, 빈도) 리스트의 내용 해시. 같은 데이터면 같은 차트 스펙을 재사용합니다.
+    """
+    payload = json.dumps(items, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def resolve_renderer(renderer, row_count):
+    if renderer == RENDERER_AUTO:
+        return RENDERER_NATIVE if row_count <= NATIVE_MAX_ROWS else RENDERER_PLOTLY
+    return renderer
+
+
+def _build_plotly_figure(items, color_scale):
+    df = pd.DataFrame(items, columns=['Keyword', 'Frequency']).sort_values(by='Frequency', ascending=True)
+    if color_scale:
+        return px.bar(df, x='Frequency', y='Keyword', orientation='h', text='Frequency', color='Frequency', color_continuous_scale=color_scale)
+    return px.bar(df, x='Frequency', y='Keyword', orientation='h', text='Frequency')
+
+
+def _build_vega_lite_spec(items, color_scale):
+    """
+    가로 막대 Top-N 차트의 Vega-Lite 스펙. 데이터 행과 최소한의 인코딩만 포함합니다.
+    """
+    color = {'value': '#1E3A8A'}
+    if color_scale:
+        color = {'field': 'Frequency', 'type': 'quantitative', 'scale': {'scheme': color_scale.lower()}, 'legend': None}
+
+    encoding = {
+        'y': {'field': 'Keyword', 'type': 'nominal', 'sort': '-x', 'title': None},
+        'x': {'field': 'Frequency', 'type': 'quantitative'},
+    }
+    return {
+        'data': {'values': [{'Keyword': keyword, 'Frequency': count} for keyword, count in items]},
+        'encoding': encoding,
+        'layer': [
+            {'mark': {'type': 'bar', 'tooltip': True}, 'encoding': {'color': color}},
+            {'mark': {'type': 'text', 'align': 'left', 'dx': 3}, 'encoding': {'text': {'field': 'Frequency'}}},
+        ],
+    }
+
+
+def get_top_n_chart(items, renderer=RENDERER_AUTO, color_scale=None):
+    """
+    Top-N (키워드, 빈도) 리스트의 차트를 반환합니다. 데이터 해시별로 한 번만 생성하여 재사용합니다.
+    반환값: {'renderer', 'chart'(plotly Figure 또는 Vega-Lite dict), 'payload_bytes', 'hash'}
+    """
+    items = [(str(keyword), int(count)) for keyword, count in items]
+    renderer = resolve_renderer(renderer, len(items))
+    digest = content_hash(items)
+    key = (digest, renderer, color_scale)
+
+    with _chart_cache_lock:
+        if key in _chart_cache:
+            _chart_cache.move_to_end(key)
+            return _chart_cache[key]
+
+    if renderer == RENDERER_PLOTLY:
+        chart = _build_plotly_figure(items, color_scale)
+        payload_bytes = len(chart.to_json().encode('utf-8'))
+    else:
+        chart = _build_vega_lite_spec(items, color_scale)
+        payload_bytes = len(json.dumps(chart, ensure_ascii=False).encode('utf-8'))
+
+    entry = {'renderer': renderer, 'chart': chart, 'payload_bytes': payload_bytes, 'hash': digest}
+    with _chart_cache_lock:
+        _chart_cache[key] = entry
+        while len(_chart_cache) > CHART_CACHE_SIZE:
+            _chart_cache.popitem(last=False)
+    return entry
+
+
+def compare_chart_payloads(items, color_scale=None):
+    """
+    같은 데이터를 Plotly와 Vega-Lite로 그릴 때의 직렬화 크기(바이트)를 비교합니다.
+    """
+    plotly_entry = get_top_n_chart(items, RENDERER_PLOTLY, color_scale)
+    native_entry = get_top_n_chart(items, RENDERER_NATIVE, color_scale)
+    return {RENDERER_PLOTLY: plotly_entry['payload_bytes'], RENDERER_NATIVE: native_entry['payload_bytes']}
@@ -0,0 +1,161 @@
+import hashlib
+import heapq
+from array import array
+from collections import Counter
+from collections.abc import Mapping
+
+# 키워드 집계 방식
+COUNT_MODE_EXACT = 'exact'
+COUNT_MODE_APPROX = 'approx'
+
+# 근사 집계 기본 파라미터
+# width=2048, depth=4 → 약 32KB 고정 메모리, 오차 상한 ≈ 총 단어 수 × e/2048 (확률 1 - e^-4)
+DEFAULT_WIDTH = 2048
+DEFAULT_DEPTH = 4
+DEFAULT_TOP_K = 200
+# 스트림을 이 크기 단위로 미리 합산한 뒤 스케치에 반영 (메모리는 배치 크기로 제한)
+BATCH_SIZE = 10_000
+
+
+def _hash_pair(item):
+    """
+    키워드를 64비트 해시 두 개로 변환합니다.
+    프로세스마다 값이 달라지는 내장 hash() 대신 blake2b를 사용해 실행마다 같은 인덱스를 얻습니다.
+    """
+    digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+    return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+
+
+class CountMinSketch:
+    """
+    고정 메모리(width × depth)로 키워드 빈도를 근사하는 Count-Min Sketch.
+    추정값은 항상 실제 빈도 이상입니다.
+    """
+
+    def __init__(self, width=DEFAULT_WIDTH, depth=DEFAULT_DEPTH):
+        self.width = width
+        self.depth = depth
+        self.total = 0
+        self.rows = [array('I', bytes(4 * width)) for _ in range(depth)]
+
+    def _indexes(self, item):
+        # 더블 해싱으로 depth개의 인덱스 생성
+        h1, h2 = _hash_pair(item)
+        return [(h1 + i * h2) % self.width for i in range(self.depth)]
+
+    def add(self, item, count=1):
+        """키워드 빈도를 더하고, 갱신 후 추정값을 반환합니다."""
+        estimate = None
+        for row, idx in zip(self.rows, self._indexes(item)):
+            row[idx] += count
+            if estimate is None or row[idx] < estimate:
+                estimate = row[idx]
+        self.total += count
+        return estimate
+
+    def estimate(self, item):
+        return min(row[idx] for row, idx in zip(self.rows, self._indexes(item)))
+
+
+class SpaceSaving:
+    """
+    최대 capacity개의 후보만 추적하는 Space-Saving Top-K 알고리즘.
+    후보가 가득 차면 최소 빈도 항목을 새 항목으로 교체하고, 교체 시점의 최소값을 오차로 기록합니다.
+    """
+
+    def __init__(self, capacity=DEFAULT_TOP_K):
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        # (빈도, 항목) 최소 힙. 증가 시 새 항목을 넣고 오래된 항목은 꺼낼 때 건너뜁니다.
+        self._heap = []
+
+    def _push(self, item):
+        heapq.heappush(self._heap, (self.counts[item], item))
+        # 낡은 항목이 쌓이면 힙을 재구성해 크기를 capacity 수준으로 유지
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(count, key) for key, count in self.counts.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_min(self):
+        while True:
+            count, item = heapq.heappop(self._heap)
+            if self.counts.get(item) == count:
+                return item, count
+
+    def add(self, item, count=1):
+        if item in self.counts:
+            self.counts[item] += count
+            self._push(item)
+            return
+
+        if len(self.counts) < self.capacity:
+            self.counts[item] = count
+            self.errors[item] = 0
+            self._push(item)
+            return
+
+        # 최소 빈도 후보를 새 항목으로 교체
+        min_item, min_count = self._pop_min()
+        del self.counts[min_item]
+        del self.errors[min_item]
+        self.counts[item] = min_count + count
+        self.errors[item] = min_count
+        self._push(item)
+
+
+class KeywordSketch(Mapping):
+    """
+    Count-Min Sketch와 Space-Saving을 결합한 근사 키워드 집계기.
+    Space-Saving이 Top-K 후보를 고르고, 빈도는 두 추정값 중 작은 값(더 정확한 쪽)을 사용합니다.
+    Counter와 같은 most_common()/get()을 제공하므로 기존 집계 코드를 그대로 대체할 수 있습니다.
+    """
+
+    def __init__(self, top_k=DEFAULT_TOP_K, width=DEFAULT_WIDTH, depth=DEFAULT_DEPTH):
+        self.cms = CountMinSketch(width, depth)
+        self.top = SpaceSaving(top_k)
+
+    def update(self, words):
+        batch = []
+        for word in words:
+            batch.append(word)
+            if len(batch) >= BATCH_SIZE:
+                self._add_batch(batch)
+                batch = []
+        if batch:
+            self._add_batch(batch)
+        return self
+
+    def _add_batch(self, batch):
+        # 배치 내 중복 단어를 먼저 합산해 해시 계산 횟수를 줄임
+        for word, count in Counter(batch).items():
+            self.cms.add(word, count)
+            self.top.add(word, count)
+
+    def __getitem__(self, item):
+        if item not in self.top.counts:
+            raise KeyError(item)
+        return min(self.top.counts[item], self.cms.estimate(item))
+
+    def __iter__(self):
+        return iter(self.top.counts)
+
+    def __len__(self):
+        return len(self.top.counts)
+
+    def most_common(self, n=None):
+        items = sorted(self.items(), key=lambda x: x[1], reverse=True)
+        return items if n is None else items[:n]
+
+
+def count_keywords(words, mode=COUNT_MODE_EXACT, top_k=DEFAULT_TOP_K):
+    """
+    키워드 빈도를 집계합니다.
+    mode: 'exact' (Counter, 고유 단어 전체 보관) 또는 'approx' (집계 상태만 고정 크기인 근사 집계)
+    근사 집계도 입력 리스트 자체의 메모리는 줄이지 않으며, 속도는 Counter보다 느립니다.
+    (benchmarks/keyword_counting.py 참고)
+    반환값은 두 경우 모두 most_common()/get()을 지원합니다.
+    """
+    if mode == COUNT_MODE_APPROX:
+        return KeywordSketch(top_k=top_k).update(words)
+    return Counter(words)
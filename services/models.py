@@ -0,0 +1,67 @@
+from dataclasses import dataclass, fields
+import pandas as pd
+
+# 화면/표에 표시할 컬럼명 (필드명 → 표시명)
+DISPLAY_COLUMNS = {
+    'video_id': 'VideoId',
+    'title': 'Title',
+    'link': 'Link',
+    'thumbnail': 'Thumbnail',
+    'description': 'Description',
+    'views': 'Views',
+    'likes': 'Likes',
+    'date': 'Date',
+    'score': 'Score',
+    'duration': 'Duration',
+    'tags': 'Tags',
+    'keyword': 'Keyword',
+    'video_type': 'Type',
+    'rank': 'Rank',
+}
+
+
+@dataclass(slots=True)
+class Video:
+    """
+    유튜브 영상 레코드. __slots__를 사용해 레코드당 메모리와 속성 접근 비용을 줄입니다.
+    """
+    video_id: str
+    title: str
+    link: str
+    thumbnail: str = ''
+    description: str = ''
+    views: int = 0
+    likes: int = 0
+    date: str = ''          # YYYY-MM-DD
+    score: float = 0.0      # 화제성 점수 (0~100으로 정규화)
+    duration: int = 0       # 초 단위
+    tags: tuple = ()
+    keyword: str = ''       # 일괄 검색 시 해당 검색어
+    video_type: str = ''    # '롱폼' / '숏폼'
+
+
+@dataclass(slots=True)
+class Article:
+    """
+    뉴스 기사 레코드.
+    """
+    title: str
+    link: str
+    description: str = ''
+    date: str = ''
+    rank: int = 0
+
+
+def records_to_dataframe(records, columns=None):
+    """
+    Video/Article 리스트를 컬럼 단위로 모아 DataFrame으로 변환합니다.
+    columns: 포함할 필드명 리스트 (None이면 전체 필드)
+    """
+    if not records:
+        return pd.DataFrame(columns=[DISPLAY_COLUMNS.get(name, name) for name in columns or []])
+
+    names = columns or [f.name for f in fields(records[0])]
+    return pd.DataFrame({
+        DISPLAY_COLUMNS.get(name, name): [getattr(record, name) for record in records]
+        for name in names
+    })
@@ -3,7 +3,15 @@ import requests
 import re
 import streamlit as st
 from bs4 import BeautifulSoup
+from services.models import Article
+from services.rate_limiter import acquire, RateLimitExceeded
+from services.cache_backend import cached
 
+# 응답 캐시 유지 시간 (초)
+RANKING_CACHE_TTL = 300
+SEARCH_CACHE_TTL = 600
+
+@cached('naver_ranking', ttl=RANKING_CACHE_TTL)
 def get_naver_ranking_news(limit=50):
     """
     네이버 뉴스 랭킹 페이지를 크롤링하여 많이 본 뉴스를 반환합니다.
@@ -16,6 +24,7 @@ def get_naver_ranking_news(limit=50):
     }
     
     try:
+        acquire('naver_scrape')
         response = requests.get(url, headers=headers)
         if response.status_code != 200:
             st.error(f"네이버 랭킹 뉴스 가져오기 실패: {response.status_code}")
@@ -37,18 +46,22 @@ def get_naver_ranking_news(limit=50):
             href = link.get('href')
             
             if href:
-                news_items.append({
-                    'Title': title,
-                    'Link': href,
-                    'Rank': len(news_items) + 1
-                })
+                news_items.append(Article(
+                    title=title,
+                    link=href,
+                    rank=len(news_items) + 1
+                ))
                 
         return news_items
         
+    except RateLimitExceeded as e:
+        st.warning(f"네이버 호출 제한: {e}")
+        return []
     except Exception as e:
         st.error(f"크롤링 중 오류 발생: {e}")
         return []
 
+@cached('naver_trending', ttl=SEARCH_CACHE_TTL)
 def get_naver_trending_topics(client_id, client_secret, category='news', max_results=100, sort='date', custom_query=None):
     """
     네이버 뉴스 검색 API를 사용하여 트렌드 키워드를 추출합니다.
@@ -82,6 +95,7 @@ def get_naver_trending_topics(client_id, client_secret, category='news', max_res
     }
     
     try:
+        acquire('naver_api', client_id)
         response = requests.get(url, headers=headers, params=params)
         
         if response.status_code == 200:
@@ -96,24 +110,32 @@ def get_naver_trending_topics(client_id, client_secret, category='news', max_res
                 title = item['title']
                 # HTML 태그 제거
                 clean_title = re.sub(r'<[^>]+>', '', title)
+                clean_desc = re.sub(r'<[^>]+>', '', item.get('description', ''))
                 # 한글만 추출 (2글자 이상)
                 words = re.findall(r'[가-힣]{2,}', clean_title)
                 all_words.extend(words)
                 
-                article_data.append({
-                    'Title': clean_title,
-                    'Link': item.get('link', '')
-                })
+                # 링크는 뉴스 검색(get_naver_news_list)과 같은 기준으로 저장해 검색 인덱스에서 같은 문서로 취급
+                article_data.append(Article(
+                    title=clean_title,
+                    link=item.get('originallink') or item.get('link', ''),
+                    description=clean_desc,
+                    date=item.get('pubDate', '')
+                ))
             
             return all_words, article_data
         else:
             st.error(f"네이버 API 오류: {response.status_code} - {response.text}")
             return [], []
             
+    except RateLimitExceeded as e:
+        st.warning(f"네이버 API 호출 제한: {e}")
+        return [], []
     except Exception as e:
         st.error(f"네이버 API 호출 중 오류 발생: {e}")
         return [], []
 
+@cached('naver_news', ttl=SEARCH_CACHE_TTL)
 def get_naver_news_list(client_id, client_secret, query='최신', display=100, sort='date'):
     """
     네이버 뉴스 검색 API를 사용하여 뉴스 리스트를 반환합니다.
@@ -132,6 +154,7 @@ def get_naver_news_list(client_id, client_secret, query='최신', display=100, s
     }
     
     try:
+        acquire('naver_api', client_id)
         response = requests.get(url, headers=headers, params=params)
         
         if response.status_code == 200:
@@ -148,18 +171,21 @@ def get_naver_news_list(client_id, client_secret, query='최신', display=100, s
                 clean_title = re.sub(r'<[^>]+>', '', title)
                 clean_desc = re.sub(r'<[^>]+>', '', description)
                 
-                news_list.append({
-                    'Title': clean_title,
-                    'Description': clean_desc,
-                    'Date': item.get('pubDate', ''),
-                    'Link': item.get('originallink') or item.get('link', '')
-                })
+                news_list.append(Article(
+                    title=clean_title,
+                    link=item.get('originallink') or item.get('link', ''),
+                    description=clean_desc,
+                    date=item.get('pubDate', '')
+                ))
             
             return news_list
         else:
             st.error(f"네이버 API 오류: {response.status_code} - {response.text}")
             return []
             
+    except RateLimitExceeded as e:
+        st.warning(f"네이버 API 호출 제한: {e}")
+        return []
     except Exception as e:
         st.error(f"네이버 API 호출 중 오류 발생: {e}")
         return []
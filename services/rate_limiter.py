@@ -0,0 +1,178 @@
+import hashlib
+import heapq
+import itertools
+import threading
+import time
+from datetime import date
+from services.cache_backend import get_state_backend
+
+# 우선순위 (숫자가 작을수록 먼저 처리)
+PRIORITY_INTERACTIVE = 0   # 페이지에서 사용자가 직접 요청한 호출
+PRIORITY_BACKGROUND = 1    # 일괄 검색 등 대량 수집 호출
+
+# 우선순위별 기본 대기 한도 (초). 한도 안에 호출 가능해지지 않으면 RateLimitExceeded
+DEFAULT_TIMEOUTS = {
+    PRIORITY_INTERACTIVE: 15,
+    PRIORITY_BACKGROUND: 120,
+}
+
+# 외부 API별 호출 제한
+# rate: 초당 허용 호출 수, burst: 순간 최대 호출 수, daily_limit: 일일 한도 (호출 비용 합계 기준)
+RATE_LIMITS = {
+    # 네이버 검색 API: 초당 10회, 클라이언트 ID당 일 25,000회
+    'naver_api': {'rate': 10, 'burst': 10, 'daily_limit': 25000},
+    # 네이버 랭킹 페이지 크롤링: 초당 1회로 제한
+    'naver_scrape': {'rate': 1, 'burst': 1, 'daily_limit': None},
+    # YouTube Data API: 분당 호출 수 제한 + 일일 할당량 10,000 단위 (search=100, videos.list=1)
+    'youtube_api': {'rate': 300 / 60, 'burst': 10, 'daily_limit': 10000},
+}
+
+# 일일 사용량은 여러 프로세스/레플리카가 공유하도록 상태 백엔드에 (서비스, 자격 증명, 날짜) 키로 저장
+DAILY_COUNTER_NAMESPACE = "rate_limit"
+# 날짜가 지난 카운터는 상태 백엔드의 만료 정리로 삭제
+DAILY_COUNTER_TTL = 2 * 86400
+
+
+class RateLimitExceeded(Exception):
+    """대기 한도 내에 호출할 수 없거나 일일 한도를 모두 사용한 경우 발생합니다."""
+
+
+class RateLimiter:
+    """
+    자격 증명 하나에 대한 토큰 버킷 + 일일 카운터.
+    토큰이 없으면 즉시 실패하지 않고 대기열에서 기다리며, 대기열은 우선순위 → 도착 순으로 처리됩니다.
+    토큰 버킷(초당 제한)은 프로세스별로 유지하고, 일일 카운터는 상태 백엔드에서 원자적으로 갱신하여
+    재시작이나 여러 레플리카 실행에도 자격 증명당 하나의 한도를 공유합니다.
+    """
+
+    def __init__(self, rate, burst, daily_limit=None, service='', credential=''):
+        self.rate = rate
+        self.burst = burst
+        self.daily_limit = daily_limit
+        self.service = service
+        # 자격 증명(API 키)은 원문 대신 해시로 저장 키에 사용
+        self.credential_id = hashlib.sha256(credential.encode('utf-8')).hexdigest()[:16]
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._cond = threading.Condition()
+        self._waiters = []
+        self._seq = itertools.count()
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def _daily_key(self):
+        return f"{DAILY_COUNTER_NAMESPACE}:{self.service}:{self.credential_id}:{date.today().isoformat()}"
+
+    def _daily_used(self):
+        return get_state_backend().get(self._daily_key(), 0)
+
+    def _check_daily(self, cost):
+        if self.daily_limit is not None and self._daily_used() + cost > self.daily_limit:
+            raise RateLimitExceeded(f"일일 호출 한도({self.daily_limit:,})를 모두 사용했습니다.")
+
+    def _consume_daily(self, cost):
+        """한도 확인과 차감을 하나의 원자적 갱신으로 처리합니다. (다른 프로세스와 동시에 차감해도 초과하지 않음)"""
+        if self.daily_limit is None:
+            return
+
+        def apply(used):
+            if used + cost > self.daily_limit:
+                raise RateLimitExceeded(f"일일 호출 한도({self.daily_limit:,})를 모두 사용했습니다.")
+            return used + cost
+
+        get_state_backend().update(self._daily_key(), apply, default=0, ttl=DAILY_COUNTER_TTL)
+
+    def acquire(self, cost=1, priority=PRIORITY_INTERACTIVE, timeout=None):
+        """
+        호출 권한을 얻을 때까지 대기합니다.
+        cost: 일일 한도에서 차감할 비용 (예: YouTube search=100)
+        timeout: 최대 대기 시간(초). None이면 우선순위별 기본값 사용
+        """
+        if timeout is None:
+            timeout = DEFAULT_TIMEOUTS.get(priority, DEFAULT_TIMEOUTS[PRIORITY_BACKGROUND])
+        deadline = time.monotonic() + timeout
+        waiter = (priority, next(self._seq))
+
+        with self._cond:
+            self._check_daily(cost)
+            heapq.heappush(self._waiters, waiter)
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+
+                    # 대기열 맨 앞(가장 높은 우선순위)일 때만 토큰 사용
+                    if self._waiters[0] == waiter and self.tokens >= 1:
+                        self._consume_daily(cost)
+                        self.tokens -= 1
+                        return
+
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        raise RateLimitExceeded(f"호출 대기 시간({timeout}초)을 초과했습니다.")
+
+                    wait = remaining
+                    if self._waiters[0] == waiter:
+                        wait = min(wait, (1 - self.tokens) / self.rate)
+                    self._cond.wait(wait)
+            finally:
+                self._waiters.remove(waiter)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+
+    def remaining_daily(self):
+        """오늘 남은 일일 한도(모든 프로세스 합산 기준)를 반환합니다. 한도가 없으면 None."""
+        if self.daily_limit is None:
+            return None
+        return max(self.daily_limit - self._daily_used(), 0)
+
+    def status(self):
+        with self._cond:
+            self._refill(time.monotonic())
+            tokens = round(self.tokens, 2)
+            waiting = len(self._waiters)
+        return {
+            'tokens': tokens,
+            'waiting': waiting,
+            'daily_used': self._daily_used(),
+            'daily_limit': self.daily_limit,
+        }
+
+
+class RateLimitScheduler:
+    """
+    서비스 + 자격 증명별 RateLimiter를 관리합니다. 프로세스 안의 모든 세션이 같은 인스턴스를 공유합니다.
+    (일일 카운터는 상태 백엔드를 통해 프로세스 간에도 공유)
+    """
+
+    def __init__(self, limits=RATE_LIMITS):
+        self.limits = limits
+        self._limiters = {}
+        self._lock = threading.Lock()
+
+    def get_limiter(self, service, credential=''):
+        key = (service, credential)
+        with self._lock:
+            if key not in self._limiters:
+                self._limiters[key] = RateLimiter(**self.limits[service], service=service, credential=credential)
+            return self._limiters[key]
+
+    def acquire(self, service, credential='', cost=1, priority=PRIORITY_INTERACTIVE, timeout=None):
+        self.get_limiter(service, credential).acquire(cost=cost, priority=priority, timeout=timeout)
+
+
+_scheduler = RateLimitScheduler()
+
+
+def get_scheduler():
+    """프로세스 전역 스케줄러를 반환합니다."""
+    return _scheduler
+
+
+def acquire(service, credential='', cost=1, priority=PRIORITY_INTERACTIVE, timeout=None):
+    """
+    외부 호출 직전에 호출하여 해당 서비스/자격 증명의 호출 권한을 얻습니다.
+    """
+    _scheduler.acquire(service, credential, cost=cost, priority=priority, timeout=timeout)
@@ -0,0 +1,195 @@
+import os
+import re
+import sqlite3
+from datetime import datetime
+import streamlit as st
+from services.models import Article
+
+# 로컬 검색 인덱스 위치
+SEARCH_INDEX_PATH = os.path.join("data", "search_index.db")
+
+# 문서 출처
+SOURCE_NAVER_NEWS = 'naver_news'
+SOURCE_NAVER_RANKING = 'naver_ranking'
+SOURCE_YOUTUBE = 'youtube'
+
+# 한글 연속 구간 / 그 외 단어(영문, 숫자)
+_TOKEN_PATTERN = re.compile(r'[가-힣]+|[A-Za-z0-9]+')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    link TEXT NOT NULL UNIQUE,
+    source TEXT NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    date TEXT NOT NULL DEFAULT '',
+    indexed_at TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+    title, description, tokenize = 'unicode61'
+);
+"""
+
+
+def _tokenize_runs(text):
+    """
+    텍스트를 토큰 구간(run) 리스트로 변환합니다.
+    한글은 형태소 분석 없이도 부분 검색이 되도록 2글자 단위(bigram)로 겹쳐 자르고,
+    영문/숫자는 소문자 단어 그대로 사용합니다.
+    """
+    runs = []
+    for match in _TOKEN_PATTERN.finditer(text or ''):
+        word = match.group()
+        if word[0] >= '가' and len(word) > 1:
+            runs.append([word[i:i + 2] for i in range(len(word) - 1)])
+        else:
+            runs.append([word.lower()])
+    return runs
+
+
+def _to_index_text(text):
+    tokens = []
+    for run in _tokenize_runs(text):
+        tokens.extend(run)
+        # 마지막 글자는 bigram의 첫 글자가 되지 않으므로 한 글자 접두사 검색을 위해 따로 색인
+        if run[0] >= '가' and len(run[0]) == 2:
+            tokens.append(run[-1][-1])
+    return ' '.join(tokens)
+
+
+def _to_match_query(query):
+    """
+    검색어를 FTS5 MATCH 식으로 변환합니다. 각 구간은 연속된 bigram 구문(phrase)으로 검색합니다.
+    한 글자 한글은 bigram이 만들어지지 않으므로 해당 글자로 시작하는 토큰의 접두사 검색("삼"*)을 사용합니다.
+    """
+    phrases = []
+    for run in _tokenize_runs(query):
+        if len(run) == 1 and len(run[0]) == 1 and run[0] >= '가':
+            phrases.append(f'"{run[0]}"*')
+        else:
+            phrases.append('"' + ' '.join(run) + '"')
+    return ' AND '.join(phrases)
+
+
+def _connect(path):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _merge_description(stored, new):
+    # 같은 문서를 설명 없이/있이 여러 경로로 수집할 수 있으므로 기존 내용을 잃지 않고 보강
+    if not stored or stored in new:
+        return new
+    if new in stored:
+        return stored
+    return f"{new} {stored}"
+
+
+def index_documents(items, source, path=SEARCH_INDEX_PATH):
+    """
+    수집한 기사/영상 리스트를 검색 인덱스에 추가합니다.
+    이미 저장된 링크는 설명이 비어 있었거나 새 설명이 더 있을 때만 설명을 보강하고 다시 색인합니다.
+    items: Video 또는 Article 리스트 (영상은 설명과 태그를 함께 색인)
+    반환값: 새로 추가된 문서 수
+    """
+    if not items:
+        return 0
+
+    now = datetime.now().isoformat(timespec='seconds')
+    added = 0
+    try:
+        conn = _connect(path)
+        with conn:
+            for item in items:
+                link = item.link
+                if not link:
+                    continue
+
+                title = item.title
+                description = ' '.join([item.description, *getattr(item, 'tags', ())]).strip()
+                row = conn.execute("SELECT id, title, description FROM documents WHERE link = ?", (link,)).fetchone()
+                if row is None:
+                    cursor = conn.execute(
+                        "INSERT INTO documents (link, source, title, description, date, indexed_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (link, source, title, description, item.date, now)
+                    )
+                    doc_id = cursor.lastrowid
+                    added += 1
+                else:
+                    doc_id, title, stored = row
+                    merged = _merge_description(stored, description)
+                    if merged == stored:
+                        continue
+                    description = merged
+                    conn.execute(
+                        "UPDATE documents SET description = ?, date = CASE WHEN date = '' THEN ? ELSE date END, indexed_at = ? "
+                        "WHERE id = ?",
+                        (description, item.date, now, doc_id)
+                    )
+                    conn.execute("DELETE FROM documents_fts WHERE rowid = ?", (doc_id,))
+
+                conn.execute(
+                    "INSERT INTO documents_fts (rowid, title, description) VALUES (?, ?, ?)",
+                    (doc_id, _to_index_text(title), _to_index_text(description))
+                )
+        conn.close()
+    except sqlite3.Error as e:
+        st.warning(f"검색 인덱스 저장 중 오류 발생: {e}")
+    return added
+
+
+def search_documents(query, source=None, limit=50, path=SEARCH_INDEX_PATH):
+    """
+    저장된 인덱스에서 검색어와 일치하는 문서를 관련도(BM25) 순의 Article 리스트로 반환합니다. (API 호출 없음)
+    source: None이면 전체, 아니면 해당 출처만 검색
+    """
+    match_query = _to_match_query(query)
+    if not match_query or not os.path.exists(path):
+        return []
+
+    sql = (
+        "SELECT d.title, d.description, d.date, d.link "
+        "FROM documents_fts f JOIN documents d ON d.id = f.rowid "
+        "WHERE documents_fts MATCH ?"
+    )
+    params = [match_query]
+    if source:
+        sql += " AND d.source = ?"
+        params.append(source)
+    sql += " ORDER BY bm25(documents_fts, 2.0, 1.0) LIMIT ?"
+    params.append(limit)
+
+    try:
+        conn = _connect(path)
+        rows = conn.execute(sql, params).fetchall()
+        conn.close()
+    except sqlite3.Error as e:
+        st.error(f"검색 인덱스 조회 중 오류 발생: {e}")
+        return []
+
+    return [
+        Article(title=title, link=link, description=description, date=date)
+        for title, description, date, link in rows
+    ]
+
+
+def get_index_stats(path=SEARCH_INDEX_PATH):
+    """
+    출처별 인덱스 문서 수를 반환합니다.
+    """
+    if not os.path.exists(path):
+        return {}
+
+    try:
+        conn = _connect(path)
+        rows = conn.execute("SELECT source, COUNT(*) FROM documents GROUP BY source").fetchall()
+        conn.close()
+    except sqlite3.Error:
+        return {}
+    return dict(rows)
@@ -0,0 +1,134 @@
+import io
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from PIL import Image
+
+# 썸네일 캐시 위치 및 용량 (초과 시 오래 사용되지 않은 파일부터 삭제)
+THUMBNAIL_DIR = os.path.join("data", "thumbnails")
+MAX_CACHE_BYTES = 200 * 1024 * 1024
+
+# 저장 크기/품질 (카드 폭에 맞춰 축소 후 JPEG 압축)
+THUMBNAIL_SIZE = (320, 180)
+JPEG_QUALITY = 75
+
+# 최근 이 시간(초) 안에 사용된 파일은 삭제하지 않음 (다른 프로세스가 방금 반환한 경로 보호)
+EVICT_GRACE_SECONDS = 120
+
+DOWNLOAD_TIMEOUT = 10
+MAX_WORKERS = 8
+
+def _cache_path(video_id, cache_dir):
+    return os.path.join(cache_dir, f"{video_id}.jpg")
+
+
+def _download_thumbnail(session, url, path):
+    """
+    썸네일을 내려받아 축소/압축한 뒤 저장합니다. 반환값: (원본 바이트 수, 저장 바이트 수)
+    """
+    response = session.get(url, timeout=DOWNLOAD_TIMEOUT)
+    response.raise_for_status()
+
+    image = Image.open(io.BytesIO(response.content)).convert('RGB')
+    image.thumbnail(THUMBNAIL_SIZE)
+
+    # 임시 파일에 쓴 뒤 교체하여 다른 프로세스가 반쯤 쓰인 파일을 읽지 않도록 함
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        image.save(tmp_path, format='JPEG', quality=JPEG_QUALITY, optimize=True)
+        os.replace(tmp_path, path)
+    except Exception:
+        # 남은 임시 파일은 용량 정리(_evict) 대상이 아니므로 직접 삭제
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return len(response.content), os.path.getsize(path)
+
+
+def _evict(cache_dir, max_bytes):
+    """
+    캐시 용량이 max_bytes를 넘으면 마지막 사용 시각(mtime)이 오래된 파일부터 삭제합니다.
+    여러 프로세스가 같은 디렉터리를 공유하므로 EVICT_GRACE_SECONDS 안에 사용된 파일은 건너뜁니다.
+    """
+    entries = []
+    total = 0
+    for entry in os.scandir(cache_dir):
+        if entry.is_file() and entry.name.endswith('.jpg'):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+
+    if total <= max_bytes:
+        return
+
+    entries.sort()
+    cutoff = time.time() - EVICT_GRACE_SECONDS
+    for mtime, size, path in entries:
+        if total <= max_bytes or mtime > cutoff:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+
+def prefetch_thumbnails(videos, cache_dir=THUMBNAIL_DIR, max_bytes=MAX_CACHE_BYTES, max_workers=MAX_WORKERS):
+    """
+    영상 리스트의 썸네일을 로컬 캐시에 준비합니다.
+    캐시에 없는 썸네일만 병렬로 한 번에 내려받으며, 실패한 항목은 결과에서 빠집니다. (원격 URL 사용)
+    반환값: ({video_id: 로컬 파일 경로}, 이번 호출의 통계)
+      통계: hits(캐시 적중, 원격 요청 생략), downloads/failures, downloaded_bytes(원격에서 받은 바이트),
+            served_bytes(로컬 캐시에서 제공한 바이트)
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+
+    paths = {}
+    missing = []
+    hits = 0
+    served = 0
+    for video in videos:
+        if not video.thumbnail or video.video_id in paths:
+            continue
+
+        path = _cache_path(video.video_id, cache_dir)
+        try:
+            # 적중 시 mtime을 갱신해 LRU 순서 유지
+            os.utime(path)
+            served += os.path.getsize(path)
+            paths[video.video_id] = path
+            hits += 1
+        except OSError:
+            missing.append((video.video_id, video.thumbnail, path))
+
+    downloads = failures = downloaded_bytes = stored_bytes = 0
+    if missing:
+        with requests.Session() as session, ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_download_thumbnail, session, url, path): (video_id, path)
+                for video_id, url, path in missing
+            }
+            for future, (video_id, path) in futures.items():
+                try:
+                    original_size, stored_size = future.result()
+                except Exception:
+                    failures += 1
+                    continue
+                paths[video_id] = path
+                downloads += 1
+                downloaded_bytes += original_size
+                stored_bytes += stored_size
+        _evict(cache_dir, max_bytes)
+
+    stats = {
+        'hits': hits,
+        'downloads': downloads,
+        'failures': failures,
+        'downloaded_bytes': downloaded_bytes,
+        'served_bytes': served + stored_bytes,
+    }
+    return paths, stats
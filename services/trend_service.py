@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta
+from services.cache_backend import get_state_backend
+
+# 트렌드 스냅샷 상태 저장 키 (장기 보관 상태 백엔드, 캐시 비우기와 분리)
+TREND_STATE_KEY = "trend_state"
+
+# EMA 평활 계수 (클수록 최근 스냅샷 비중이 큼)
+EMA_ALPHA = 0.5
+# EMA가 이 값 미만으로 떨어진 태그는 상태에서 제거 (상태 크기 제한)
+EMA_PRUNE_THRESHOLD = 0.05
+# 스냅샷 최소 간격 (분). 응답 캐시(최대 30분) 안에서 반복 분석해도 같은 데이터가 중복 누적되지 않도록 함
+SNAPSHOT_MIN_INTERVAL_MINUTES = 30
+
+
+def load_trend_state():
+    """
+    저장된 트렌드 상태를 불러옵니다. 없으면 빈 상태를 반환합니다.
+    상태 구조: {source: {'snapshots': int, 'updated_at': str, 'tags': {tag: {...}}}}
+    """
+    return get_state_backend().get(TREND_STATE_KEY, {})
+
+
+def record_trend_snapshot(source, counts, alpha=EMA_ALPHA):
+    """
+    새 스냅샷을 저장된 상태에 반영합니다.
+    여러 프로세스가 동시에 기록해도 유실되지 않도록 백엔드의 원자적 update를 사용합니다.
+    반환값: 갱신된 전체 상태
+    """
+    def apply(state):
+        update_trend_state(state, source, dict(counts), alpha=alpha)
+        return state
+
+    return get_state_backend().update(TREND_STATE_KEY, apply, default={})
+
+
+def get_snapshot_source(base, sample_size, count_mode):
+    """
+    스냅샷 출처 키를 만듭니다. 스냅샷은 원시 빈도를 저장하므로
+    수집 개수나 집계 방식이 다르면 같은 출처라도 별도 소스로 관리합니다. (예: 'youtube_KR_n50_exact')
+    """
+    return f"{base}_n{sample_size}_{count_mode}"
+
+
+def update_trend_state(state, source, counts, alpha=EMA_ALPHA, timestamp=None):
+    """
+    새 스냅샷(태그별 빈도)을 받아 해당 소스의 롤링 상태를 증분 갱신합니다.
+    과거 스냅샷 전체를 재계산하지 않고, 태그별로 직전 빈도/변화량/증가율/EMA만 유지합니다.
+    source: 'youtube_KR', 'naver_news' 등 스냅샷 출처 키
+    counts: {tag: frequency} (Counter 가능)
+    SNAPSHOT_MIN_INTERVAL_MINUTES 이내에 들어온 스냅샷은 반영하지 않습니다.
+    빈도가 직전과 같아도 반영하여 변화량 0과 EMA 수렴으로 꾸준한 태그를 급상승 태그와 구분합니다.
+    """
+    source_state = state.setdefault(source, {'snapshots': 0, 'updated_at': None, 'tags': {}})
+    timestamp = timestamp or datetime.now()
+
+    # 최소 간격이 지나지 않았으면 같은 캐시 응답일 수 있으므로 새 데이터 포인트로 보지 않음
+    if source_state['updated_at']:
+        elapsed = timestamp - datetime.fromisoformat(source_state['updated_at'])
+        if elapsed < timedelta(minutes=SNAPSHOT_MIN_INTERVAL_MINUTES):
+            return source_state
+
+    tags = source_state['tags']
+    first_snapshot = source_state['snapshots'] == 0
+
+    # 이번 스냅샷에 없는 기존 태그는 빈도 0으로 간주 (EMA 감쇠)
+    for tag in set(tags) | set(counts):
+        count = counts.get(tag, 0)
+        entry = tags.get(tag)
+
+        if entry is None:
+            # 신규 태그: 이전 빈도 0에서 등장한 것으로 처리
+            # 첫 스냅샷은 비교 대상이 없으므로 현재 빈도를 기준값으로 초기화
+            baseline = count if first_snapshot else 0
+            entry = {'count': baseline, 'ema': float(baseline), 'seen': 0}
+            tags[tag] = entry
+
+        prev_count = entry['count']
+        delta = count - prev_count
+
+        entry['prev_count'] = prev_count
+        entry['count'] = count
+        entry['delta'] = delta
+        # 이전 빈도가 0이면 분모를 1로 두어 신규 등장 태그의 증가율을 표현
+        entry['growth'] = round(delta / max(prev_count, 1), 4)
+        if not first_snapshot:
+            entry['ema'] = round(alpha * count + (1 - alpha) * entry['ema'], 4)
+        if count > 0:
+            entry['seen'] += 1
+
+        if count == 0 and entry['ema'] < EMA_PRUNE_THRESHOLD:
+            del tags[tag]
+
+    source_state['snapshots'] += 1
+    source_state['updated_at'] = timestamp.isoformat(timespec='seconds')
+    return source_state
+
+
+def get_rising_keywords(state, source, top_n=20, min_count=2):
+    """
+    증가량(delta)과 EMA 대비 현재 빈도를 기준으로 급상승 키워드를 반환합니다.
+    꾸준히 상위권인 태그(현재 빈도 ≈ EMA)보다 새로 치고 올라온 태그가 위로 옵니다.
+    """
+    source_state = state.get(source)
+    if not source_state or source_state['snapshots'] < 2:
+        return []
+
+    rising = []
+    for tag, entry in source_state['tags'].items():
+        if entry['count'] < min_count or entry['delta'] <= 0:
+            continue
+
+        rising.append({
+            'Keyword': tag,
+            'Frequency': entry['count'],
+            'Delta': entry['delta'],
+            'Growth': entry['growth'],
+            'EMA': entry['ema'],
+            # 모멘텀: 현재 빈도가 장기 평균(EMA)을 얼마나 웃도는지
+            'Momentum': round(entry['count'] - entry['ema'], 2)
+        })
+
+    rising.sort(key=lambda x: (x['Momentum'], x['Delta']), reverse=True)
+    return rising[:top_n]
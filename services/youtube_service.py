@@ -1,31 +1,92 @@
 
+import math
 import re
+from dataclasses import replace
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from functools import lru_cache
+from operator import attrgetter
 import streamlit as st
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from services.models import Video
+from services.rate_limiter import acquire, get_scheduler, RateLimitExceeded, PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND
+from services.cache_backend import cached
 
+# 응답 캐시 유지 시간 (초)
+YOUTUBE_CACHE_TTL = 1800
+
+# ISO 8601 duration (예: PT1H2M10S, P1DT2H, P2W). 연/월은 영상 길이에 쓰이지 않으므로 제외
+DURATION_PATTERN = re.compile(
+    r'^P(?:(?P<weeks>\d+)W)?(?:(?P<days>\d+)D)?'
+    r'(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+(?:\.\d+)?)S)?)?$'
+)
+DURATION_UNITS = {'weeks': 604800, 'days': 86400, 'hours': 3600, 'minutes': 60, 'seconds': 1}
+
+# 숏폼 분류 기준 (초). YouTube Shorts는 최대 3분까지 허용
+SHORTS_MAX_SECONDS = 180
+
+# 길이 분포 구간: (상한 초, 라벨). 상한 이하이면 해당 구간 (숏폼 기준 'N초 이하'와 경계를 맞춤)
+DURATION_BUCKETS = [
+    (60, '1분 이하'),
+    (180, '1~3분'),
+    (600, '3~10분'),
+    (None, '10분 초과'),
+]
+
+@lru_cache(maxsize=4096)
 def parse_duration(duration_str):
     """
-    ISO 8601 duration 문자열(PT1H2M10S)을 초 단위로 변환합니다.
+    ISO 8601 duration 문자열(PT1H2M10S, P1DT2H 등)을 초 단위로 변환합니다.
+    같은 길이 값이 반복되는 경우가 많아 결과를 캐시합니다.
     """
-    match = re.match(r'PT(\d+H)?(\d+M)?(\d+S)?', duration_str)
+    match = DURATION_PATTERN.match(duration_str or '')
     if not match:
         return 0
     
-    hours = int(match.group(1)[:-1]) if match.group(1) else 0
-    minutes = int(match.group(2)[:-1]) if match.group(2) else 0
-    seconds = int(match.group(3)[:-1]) if match.group(3) else 0
+    total = 0
+    for unit, value in match.groupdict().items():
+        if value:
+            total += float(value) * DURATION_UNITS[unit]
+            
+    return int(total)
+
+def get_duration_bucket(duration_sec):
+    """
+    영상 길이(초)가 속하는 분포 구간 라벨을 반환합니다.
+    """
+    for upper, label in DURATION_BUCKETS:
+        if upper is None or duration_sec <= upper:
+            return label
+
+def classify_videos(videos, shorts_threshold=SHORTS_MAX_SECONDS):
+    """
+    영상 리스트를 한 번 순회하며 롱폼/숏폼 분류와 길이 구간별 집계를 함께 수행합니다.
+    shorts_threshold: 이 길이(초) 이하는 숏폼으로 분류
+    반환값: (롱폼 리스트, 숏폼 리스트, {구간 라벨: 개수})
+    """
+    long_forms = []
+    shorts = []
+    buckets = {label: 0 for _, label in DURATION_BUCKETS}
     
-    return hours * 3600 + minutes * 60 + seconds
+    for video in videos:
+        if video.duration <= shorts_threshold:
+            video.video_type = '숏폼'
+            shorts.append(video)
+        else:
+            video.video_type = '롱폼'
+            long_forms.append(video)
+        buckets[get_duration_bucket(video.duration)] += 1
+        
+    return long_forms, shorts, buckets
 
 def calculate_popularity_score(video_info):
     """
     Time Decay (Hacker News style) 알고리즘을 사용하여 인기 점수를 계산합니다.
     Score = (V*1 + L*30 + C*100) / (Time + 2)^1.8
     """
-    view_count = video_info['Views']
-    like_count = video_info['Likes'] if video_info['Likes'] else 0
+    view_count = video_info.views
+    like_count = video_info.likes if video_info.likes else 0
     # 댓글 수는 API 비용 문제로 생략하거나 0으로 처리 (현재 로직상 데이터가 없음)
     comment_count = 0 
     
@@ -39,12 +100,12 @@ def calculate_popularity_score(video_info):
     
     # 시간 감쇠 적용
     # 게시 시간 파싱 (YYYY-MM-DD or ISO 8601)
-    # search_youtube_videos에서 'Date'는 'YYYY-MM-DD'로 잘려있을 수 있음.
+    # search_youtube_videos에서 date는 'YYYY-MM-DD'로 잘려있을 수 있음.
     # 정확도를 위해 원본 datetime 객체를 사용하거나 여기서 다시 파싱.
     # 현재 `search_youtube_videos`에서 `publishedAt` 전체를 넘겨주도록 수정 필요.
-    # 일단 'Date'가 YYYY-MM-DD만 있다고 가정하고 00:00:00으로 처리
+    # 일단 date가 YYYY-MM-DD만 있다고 가정하고 00:00:00으로 처리
     try:
-        pub_date = datetime.strptime(video_info['Date'], "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        pub_date = datetime.strptime(video_info.date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
     except:
         # 실패 시 현재 시간으로 간주 (감쇠 없음)
         pub_date = datetime.now(timezone.utc)
@@ -55,107 +116,251 @@ def calculate_popularity_score(video_info):
     trend_score = base_score / pow((hours_age + 2), GRAVITY)
     return trend_score
 
-def search_youtube_videos(api_key, query, max_results=50, region_code='KR', published_after=None, sort_by='trend'):
+# videos().list / search().list 한 번에 요청할 수 있는 최대 개수
+API_PAGE_SIZE = 50
+
+# API 호출별 일일 할당량 소모 단위
+QUOTA_COST_SEARCH = 100
+QUOTA_COST_LIST = 1
+
+def _search_video_ids(youtube, api_key, query, max_results, region_code, published_after, priority=PRIORITY_INTERACTIVE):
     """
-    키워드로 유튜브 영상을 검색하고 롱폼/숏폼으로 분류하여 반환합니다.
-    sort_by: 'trend' (화제성 점수순) or 'viewCount' (조회수순)
+    검색 API로 Video ID 목록을 가져옵니다. (50개 초과 시 페이지 단위로 이어서 요청)
     """
-    try:
-        youtube = build('youtube', 'v3', developerKey=api_key)
-        
-        # 1. 검색 (Video ID 확보)
+    video_ids = []
+    page_token = None
+    while len(video_ids) < max_results:
+        acquire('youtube_api', api_key, cost=QUOTA_COST_SEARCH, priority=priority)
         search_response = youtube.search().list(
             q=query,
             type='video',
             part='id',
-            maxResults=max_results,
+            maxResults=min(API_PAGE_SIZE, max_results - len(video_ids)),
             regionCode=region_code,
             publishedAfter=published_after,
-            order='viewCount' # 기본적으로 조회수 순으로 검색 (API 지원 시)
+            order='viewCount', # 기본적으로 조회수 순으로 검색 (API 지원 시)
+            pageToken=page_token
         ).execute()
         
-        video_ids = [item['id']['videoId'] for item in search_response.get('items', [])]
-        
-        if not video_ids:
-            return [], []
+        video_ids.extend(item['id']['videoId'] for item in search_response.get('items', []))
+        page_token = search_response.get('nextPageToken')
+        if not page_token:
+            break
             
-        # 2. 상세 정보 조회 (통계, 길이 등)
+    return video_ids
+
+def _fetch_video_items(youtube, api_key, video_ids, priority=PRIORITY_INTERACTIVE):
+    """
+    상세 정보(통계, 길이 등)를 50개 단위로 조회하여 {video_id: item} 형태로 반환합니다.
+    """
+    items = {}
+    for i in range(0, len(video_ids), API_PAGE_SIZE):
+        acquire('youtube_api', api_key, cost=QUOTA_COST_LIST, priority=priority)
         videos_response = youtube.videos().list(
-            id=','.join(video_ids),
+            id=','.join(video_ids[i:i + API_PAGE_SIZE]),
             part='snippet,statistics,contentDetails'
         ).execute()
         
-        long_forms = []
-        shorts = []
-        
         for item in videos_response.get('items', []):
-            snippet = item['snippet']
-            stats = item.get('statistics', {})
-            content_details = item.get('contentDetails', {})
-            
-            title = snippet['title']
-            published_at = snippet['publishedAt'][:10] # YYYY-MM-DD
+            items[item['id']] = item
             
-            # 통계 (None 처리)
-            view_count = int(stats.get('viewCount', 0))
-            like_count = int(stats.get('likeCount', 0)) if 'likeCount' in stats else 0
-            
-            # 길이 파싱
-            duration_str = content_details.get('duration', 'PT0S')
-            duration_sec = parse_duration(duration_str)
-            
-            # 썸네일
-            thumbnail = snippet.get('thumbnails', {}).get('medium', {}).get('url', '')
-            
-            video_info = {
-                'Thumbnail': thumbnail,
-                'Title': title,
-                'Views': view_count,
-                'Likes': like_count,
-                'Date': published_at,
-                'Link': f"https://www.youtube.com/watch?v={item['id']}",
-                'Score': 0 # 초기값
-            }
-            
-            # 점수 계산 (Raw Score)
-            video_info['Score'] = calculate_popularity_score(video_info)
+    return items
+
+def _build_video_info(item):
+    """
+    videos().list 응답 항목을 Video 레코드로 변환합니다.
+    """
+    snippet = item['snippet']
+    stats = item.get('statistics', {})
+    content_details = item.get('contentDetails', {})
+    
+    title = snippet['title']
+    published_at = snippet['publishedAt'][:10] # YYYY-MM-DD
+    
+    # 통계 (None 처리)
+    view_count = int(stats.get('viewCount', 0))
+    like_count = int(stats.get('likeCount', 0)) if 'likeCount' in stats else 0
+    
+    # 길이 파싱
+    duration_str = content_details.get('duration', 'PT0S')
+    duration_sec = parse_duration(duration_str)
+    
+    # 썸네일
+    thumbnail = snippet.get('thumbnails', {}).get('medium', {}).get('url', '')
+    
+    video_info = Video(
+        video_id=item['id'],
+        title=title,
+        link=f"https://www.youtube.com/watch?v={item['id']}",
+        thumbnail=thumbnail,
+        description=snippet.get('description', ''),
+        views=view_count,
+        likes=like_count,
+        date=published_at,
+        duration=duration_sec
+    )
+    
+    # 점수 계산 (Raw Score, 0~100 정규화는 rank_videos에서 분류 후 수행)
+    video_info.score = calculate_popularity_score(video_info)
+    return video_info
+
+def rank_videos(videos, sort_by='trend', shorts_threshold=SHORTS_MAX_SECONDS):
+    """
+    검색 결과(정규화 전 점수)를 롱폼/숏폼으로 분류하고 그룹별로 점수를 0~100점으로 스케일링한 뒤 정렬합니다.
+    API 호출 없이 세션에 보관한 결과에 적용하므로 숏폼 기준/정렬을 바꿔도 다시 검색하지 않습니다.
+    원본 레코드는 수정하지 않고 복사본을 반환합니다.
+    반환값: (롱폼 리스트, 숏폼 리스트, {길이 구간: 개수})
+    """
+    long_forms, shorts, buckets = classify_videos([replace(v) for v in videos], shorts_threshold)
+    
+    # 스케일링 (0~100점) 및 정렬
+    for video_list in [long_forms, shorts]:
+        if not video_list:
+            continue
             
-            # 60초 이하는 숏폼으로 분류
-            if duration_sec <= 60:
-                shorts.append(video_info)
+        # 최대 점수 찾기
+        max_score = max(v.score for v in video_list)
+        
+        # 정규화
+        for v in video_list:
+            if max_score > 0:
+                v.score = round((v.score / max_score) * 100, 1)
             else:
-                long_forms.append(video_info)
+                v.score = 0
+
+        # 정렬
+        if sort_by == 'trend':
+            video_list.sort(key=attrgetter('score'), reverse=True)
+        else: # viewCount
+            video_list.sort(key=attrgetter('views'), reverse=True)
+            
+    return long_forms, shorts, buckets
+
+@cached('youtube_search', ttl=YOUTUBE_CACHE_TTL)
+def search_youtube_videos(api_key, query, max_results=50, region_code='KR', published_after=None):
+    """
+    키워드로 유튜브 영상을 검색하여 Video 리스트(정규화 전 점수)를 반환합니다.
+    분류/정렬 옵션은 캐시 키에 포함되지 않도록 rank_videos로 따로 적용합니다.
+    """
+    try:
+        youtube = build('youtube', 'v3', developerKey=api_key)
         
-        # 스케일링 (0~100점) 및 정렬
-        for video_list in [long_forms, shorts]:
-            if not video_list:
-                continue
-                
-            # 최대 점수 찾기
-            max_score = max(v['Score'] for v in video_list)
+        # 1. 검색 (Video ID 확보)
+        video_ids = _search_video_ids(youtube, api_key, query, max_results, region_code, published_after)
+        
+        if not video_ids:
+            return []
             
-            # 정규화
-            for v in video_list:
-                if max_score > 0:
-                    v['Score'] = round((v['Score'] / max_score) * 100, 1)
-                else:
-                    v['Score'] = 0
-
-            # 정렬
-            if sort_by == 'trend':
-                video_list.sort(key=lambda x: x['Score'], reverse=True)
-            else: # viewCount
-                video_list.sort(key=lambda x: x['Views'], reverse=True)
-                
-        return long_forms, shorts
+        # 2. 상세 정보 조회 (통계, 길이 등)
+        video_items = _fetch_video_items(youtube, api_key, video_ids)
+        
+        return [_build_video_info(item) for item in video_items.values()]
 
+    except RateLimitExceeded as e:
+        st.warning(f"YouTube API 호출 제한: {e}")
+        return []
     except HttpError as e:
         st.error(f"YouTube API 오류 발생: {e}")
-        return [], []
+        return []
     except Exception as e:
         st.error(f"알 수 없는 오류 발생: {e}")
+        return []
+
+def estimate_search_quota(max_results, num_queries=1):
+    """
+    검색 1회(페이지 단위 search().list + 50개 단위 videos().list)의 최대 할당량 소모량 × 키워드 수를 계산합니다.
+    """
+    pages = math.ceil(max_results / API_PAGE_SIZE)
+    return pages * (QUOTA_COST_SEARCH + QUOTA_COST_LIST) * num_queries
+
+def get_remaining_quota(api_key):
+    """
+    해당 API 키로 오늘 남은 YouTube 할당량 (모든 프로세스가 공유하는 일일 카운터 기준)을 반환합니다.
+    """
+    return get_scheduler().get_limiter('youtube_api', api_key).remaining_daily()
+
+def _search_ids_worker(api_key, query, max_results, region_code, published_after):
+    # googleapiclient 클라이언트는 스레드 간 공유가 안전하지 않으므로 작업마다 생성
+    # 일괄 검색은 백그라운드 우선순위로 실행하여 다른 사용자의 단일 검색이 먼저 처리되도록 함
+    youtube = build('youtube', 'v3', developerKey=api_key)
+    return _search_video_ids(youtube, api_key, query, max_results, region_code, published_after, priority=PRIORITY_BACKGROUND)
+
+def search_youtube_videos_batch(api_key, queries, max_results=50, region_code='KR', published_after=None, max_workers=4, progress_callback=None):
+    """
+    여러 키워드를 한 번에 검색하여 키워드별로 태깅된 결과 리스트(정규화 전 점수)를 반환합니다.
+    분류/점수화는 rank_batch_results로 따로 적용합니다.
+    - 검색(search().list)은 최대 max_workers개 스레드로 병렬 실행
+    - 상세 정보(videos().list)는 모든 키워드의 Video ID를 합쳐 한 번만 조회 (중복 영상 공유)
+    progress_callback(완료 수, 전체 수, 키워드): 진행 상황 콜백 (메인 스레드에서 호출)
+    반환값: (결과 리스트, 실패한 키워드 리스트)
+    """
+    # 중복/공백 키워드 제거 (입력 순서 유지)
+    queries = list(dict.fromkeys(q.strip() for q in queries if q and q.strip()))
+    if not queries:
         return [], []
+        
+    ids_by_query = {}
+    failed = []
+    
+    # 1. 키워드별 검색 (병렬)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_search_ids_worker, api_key, query, max_results, region_code, published_after): query
+            for query in queries
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            query = futures[future]
+            try:
+                ids_by_query[query] = future.result()
+            except Exception:
+                failed.append(query)
+            if progress_callback:
+                progress_callback(done, len(queries), query)
+    
+    # 2. 상세 정보 일괄 조회 (여러 키워드에 등장한 영상은 한 번만 조회)
+    unique_ids = list(dict.fromkeys(vid for query in queries for vid in ids_by_query.get(query, [])))
+    if not unique_ids:
+        return [], failed
+        
+    try:
+        youtube = build('youtube', 'v3', developerKey=api_key)
+        video_items = _fetch_video_items(youtube, api_key, unique_ids, priority=PRIORITY_BACKGROUND)
+    except RateLimitExceeded as e:
+        st.warning(f"YouTube API 호출 제한: {e}")
+        return [], queries
+    except HttpError as e:
+        st.error(f"YouTube API 오류 발생: {e}")
+        return [], queries
+    except Exception as e:
+        st.error(f"알 수 없는 오류 발생: {e}")
+        return [], queries
+    
+    # 3. 키워드별로 태깅하여 하나의 리스트로 결합
+    results = []
+    for query in queries:
+        for vid in ids_by_query.get(query, []):
+            if vid in video_items:
+                video_info = _build_video_info(video_items[vid])
+                video_info.keyword = query
+                results.append(video_info)
+                
+    return results, failed
 
+def rank_batch_results(results, sort_by='trend', shorts_threshold=SHORTS_MAX_SECONDS):
+    """
+    일괄 검색 결과를 키워드별로 분류/점수화하여 하나의 리스트로 반환합니다. (API 호출 없음)
+    """
+    by_keyword = {}
+    for video_info in results:
+        by_keyword.setdefault(video_info.keyword, []).append(video_info)
+
+    ranked = []
+    for videos in by_keyword.values():
+        long_forms, shorts, _ = rank_videos(videos, sort_by, shorts_threshold)
+        ranked.extend(long_forms + shorts)
+    return ranked
+
+@cached('youtube_trending', ttl=YOUTUBE_CACHE_TTL)
 def get_youtube_trending_tags(api_key, region_code='KR', max_results=50):
     """
     YouTube Data API를 사용하여 인기 동영상의 태그를 수집합니다.
@@ -170,6 +375,7 @@ def get_youtube_trending_tags(api_key, region_code='KR', max_results=50):
             regionCode=region_code,
             maxResults=max_results
         )
+        acquire('youtube_api', api_key, cost=QUOTA_COST_LIST)
         response = request.execute()
         
         all_tags = []
@@ -184,14 +390,19 @@ def get_youtube_trending_tags(api_key, region_code='KR', max_results=50):
             # 태그 수집
             all_tags.extend(tags)
             
-            video_data.append({
-                'Title': title,
-                'Tags': ", ".join(tags) if tags else "None",
-                'Link': f"https://www.youtube.com/watch?v={video_id}"
-            })
+            video_data.append(Video(
+                video_id=video_id,
+                title=title,
+                link=f"https://www.youtube.com/watch?v={video_id}",
+                description=snippet.get('description', ''),
+                tags=tuple(tags)
+            ))
             
         return all_tags, video_data
         
+    except RateLimitExceeded as e:
+        st.warning(f"YouTube API 호출 제한: {e}")
+        return [], []
     except HttpError as e:
         st.error(f"YouTube API 오류 발생: {e}")
         return [], []